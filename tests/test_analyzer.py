@@ -0,0 +1,56 @@
+"""Tests for the UFW log analyzer."""
+
+import os
+from unittest.mock import patch
+
+from ufwinspector.core.analyzer import UFWLogAnalyzer
+from ufwinspector.core.parser import UFWEventType, UFWLogParser
+
+
+def test_analyze_aggregates_public_ips() -> None:
+    """Test that events are aggregated per public IP and sorted."""
+    log_file = os.path.join(os.path.dirname(__file__), "sample_ufw.log")
+    analyzer = UFWLogAnalyzer(log_file)
+
+    # Skip DNS and ISP lookups
+    with patch.object(UFWLogAnalyzer, "_resolve_names"):
+        summaries = analyzer.analyze()
+
+    assert analyzer.event_count == 10
+    assert [s.ip_address for s in summaries] == [
+        "8.8.8.8", "5.6.7.8", "1.2.3.4", "9.10.11.12", "8.8.4.4", "4.5.6.7"
+    ]
+
+    google = summaries[0]
+    assert google.count == 3
+    assert google.source_count == 3
+    assert google.destination_count == 0
+    assert google.direction_type == "Incoming"
+    assert google.source_event_types == {UFWEventType.BLOCK}
+    assert google.protocols == {"TCP"}
+    assert google.ports == {12345, 12346, 12347}
+
+    outgoing = summaries[4]
+    assert outgoing.direction_type == "Outgoing"
+    assert outgoing.destination_event_types == {UFWEventType.ALLOW}
+    assert outgoing.ports == {53}
+
+
+def test_analyze_parallel_matches_serial() -> None:
+    """Test that counting chunks in worker processes gives the same summaries."""
+    log_file = os.path.join(os.path.dirname(__file__), "sample_ufw.log")
+
+    with patch.object(UFWLogAnalyzer, "_resolve_names"):
+        serial = UFWLogAnalyzer(log_file)
+        expected = serial.analyze()
+
+        # Force the parallel path with three workers, even for a small log
+        parallel = UFWLogAnalyzer(log_file)
+        with patch("ufwinspector.core.parser.PARALLEL_PARSE_THRESHOLD", 0), \
+                patch("os.cpu_count", return_value=3), \
+                patch.object(UFWLogParser, "_map_chunks", wraps=parallel.parser._map_chunks) as map_chunks:
+            summaries = parallel.analyze()
+
+    assert map_chunks.call_count == 1
+    assert parallel.event_count == serial.event_count
+    assert summaries == expected
@@ -0,0 +1,22 @@
+"""Tests for configuration management."""
+
+import json
+import os
+import tempfile
+
+from ufwinspector.config import Config
+
+
+def test_set_defers_write_until_flush() -> None:
+    """Test that setting a value only writes the file on flush."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cfg = Config()
+        cfg.config_dir = temp_dir
+        cfg.config_file = os.path.join(temp_dir, "config.json")
+
+        cfg.set("max_entries", 50)
+        assert not os.path.exists(cfg.config_file)
+
+        cfg.flush()
+        with open(cfg.config_file, "r", encoding="utf-8") as f:
+            assert json.load(f)["max_entries"] == 50
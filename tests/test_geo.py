@@ -0,0 +1,83 @@
+"""Tests for the IP information lookup."""
+
+import json
+import os
+import tempfile
+import time
+import urllib.error
+from io import BytesIO
+from unittest.mock import patch
+
+from ufwinspector.core.geo import IPInfoLookup
+
+
+def test_cache_persists_between_instances() -> None:
+    """Test that successful lookups are reused by a new instance."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = os.path.join(temp_dir, "ipinfo_cache.json")
+
+        lookup = IPInfoLookup(cache_file)
+        lookup._store("8.8.8.8", {"ip": "8.8.8.8", "org": "AS15169 Google LLC"})
+        lookup.cache["1.2.3.4"] = {"ip": "1.2.3.4", "org": "Unknown", "error": "timeout"}
+        lookup.save_cache()
+
+        reloaded = IPInfoLookup(cache_file)
+        assert reloaded.get_isp("8.8.8.8") == "Google LLC"
+        assert "1.2.3.4" not in reloaded.cache
+
+
+def test_cache_skips_expired_entries() -> None:
+    """Test that expired lookups are not loaded from the cache file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_file = os.path.join(temp_dir, "ipinfo_cache.json")
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "8.8.8.8": {
+                    "value": {"org": "AS15169 Google LLC", "_parsed_isp": "Google LLC"},
+                    "expires_at": time.time() - 1,
+                },
+            }, f)
+
+        lookup = IPInfoLookup(cache_file)
+        assert lookup.cache == {}
+
+
+def test_batch_error_response_falls_back_to_single_lookups() -> None:
+    """Test that a batch response that is not keyed by IP is ignored."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        lookup = IPInfoLookup(os.path.join(temp_dir, "ipinfo_cache.json"))
+
+        with patch("urllib.request.urlopen", return_value=BytesIO(b'["rate limited"]')), \
+                patch.object(lookup, "_lookup") as single_lookup:
+            lookup.get_bulk(["8.8.8.8", "1.1.1.1"])
+
+        assert [call.args[0] for call in single_lookup.call_args_list] == ["8.8.8.8", "1.1.1.1"]
+
+
+def test_batch_access_denied_skips_remaining_batches() -> None:
+    """Test that batch requests stop once the endpoint refuses access."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        lookup = IPInfoLookup(os.path.join(temp_dir, "ipinfo_cache.json"))
+        ip_addresses = [f"8.8.{i // 256}.{i % 256}" for i in range(IPInfoLookup.BATCH_SIZE * 2 + 1)]
+        denied = urllib.error.HTTPError(f"{IPInfoLookup.API_URL}/batch", 403, "Forbidden", {}, None)
+
+        with patch.object(lookup, "_fetch_batch", side_effect=denied) as fetch_batch, \
+                patch.object(lookup, "_lookup") as single_lookup:
+            lookup.get_bulk(ip_addresses)
+
+        assert fetch_batch.call_count == 1
+        assert single_lookup.call_count == len(ip_addresses)
+
+
+def test_single_lookups_are_throttled() -> None:
+    """Test that consecutive single lookups wait MIN_REQUEST_INTERVAL apart."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        lookup = IPInfoLookup(os.path.join(temp_dir, "ipinfo_cache.json"))
+
+        with patch("urllib.request.urlopen", side_effect=OSError("offline")), \
+                patch("time.sleep") as sleep:
+            lookup.get_ip_info("8.8.8.8")
+            lookup.get_ip_info("1.1.1.1")
+
+        assert sleep.call_count == 1
+        assert 0 < sleep.call_args.args[0] <= IPInfoLookup.MIN_REQUEST_INTERVAL
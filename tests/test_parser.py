@@ -2,11 +2,14 @@
 
 import os
 import tempfile
+from dataclasses import FrozenInstanceError
 from datetime import datetime
+from unittest.mock import patch
 
+import dns.resolver
 import pytest
 
-from ufwinspector.core.parser import UFWEventType, UFWLogParser
+from ufwinspector.core.parser import UFWEventType, UFWLogParser, _is_public_ip
 
 
 def test_parse_block_line() -> None:
@@ -41,6 +44,54 @@ def test_parse_allow_line() -> None:
     assert event.interface == "eth0"
 
 
+def test_event_is_immutable() -> None:
+    """Test that parsed events cannot be modified and can be hashed."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    line = "Jun 15 12:34:56 hostname kernel: [12345.678901] UFW BLOCK IN=eth0 OUT= MAC=aa:bb:cc:dd:ee:ff SRC=8.8.8.8 DST=192.168.1.1 LEN=60 TOS=0x00 PREC=0x00 TTL=64 ID=12345 DF PROTO=TCP SPT=12345 DPT=80 WINDOW=65535 RES=0x00 SYN URGP=0"
+    event = parser._parse_line(line)
+
+    assert event is not None
+    with pytest.raises(FrozenInstanceError):
+        event.source_ip = "1.1.1.1"  # type: ignore[misc]
+    assert len({event, parser._parse_line(line)}) == 1
+
+
+def test_parse_syslog_timestamp() -> None:
+    """Test parsing syslog timestamps with padded and unpadded days."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    rest = " hostname kernel: [12345.678901] UFW BLOCK IN=eth0 OUT= SRC=8.8.8.8 DST=192.168.1.1 PROTO=TCP SPT=12345 DPT=80"
+    current_year = datetime.now().year
+
+    for prefix in ("Jun  5 07:08:09", "Jun 5 07:08:09"):
+        event = parser._parse_line(prefix + rest)
+        assert event is not None
+        assert event.timestamp == datetime(current_year, 6, 5, 7, 8, 9)
+
+    assert parser._parse_line("Foo 15 12:34:56" + rest) is None
+    assert parser._parse_line("Jun 31 12:34:56" + rest) is None
+
+
+def test_parse_prefixed_lines() -> None:
+    """Test lines whose timestamp is not at the start of the line."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    rest = "UFW BLOCK] IN=eth0 OUT= SRC=8.8.8.8 DST=192.168.1.1 PROTO=TCP SPT=12345 DPT=80"
+    current_year = datetime.now().year
+
+    for line in (
+        "<4>Jun 15 12:34:56 hostname kernel: [" + rest,
+        "[Sun Jun 15 12:34:56 2025] [" + rest,
+        "ufw.log:Jun 15 12:34:56 hostname kernel: [" + rest,
+    ):
+        event = parser._parse_line(line)
+        assert event is not None, line
+        assert event.timestamp == datetime(current_year, 6, 15, 12, 34, 56)
+        assert event.source_ip == "8.8.8.8"
+
+    event = parser._parse_line("ufw.log:2025-06-22T15:09:26.640097-07:00 hostname kernel: [" + rest)
+    assert event is not None
+    assert event.timestamp.year == 2025
+
+
 def test_parse_invalid_line() -> None:
     """Test parsing an invalid log line."""
     parser = UFWLogParser()
@@ -70,7 +121,7 @@ def test_parse_file() -> None:
 
 
 def test_source_is_public() -> None:
-    """Test the source_is_public property."""
+    """Test the source_is_public flag."""
     parser = UFWLogParser("")  # Empty string for testing individual lines
     
     # Public IP
@@ -84,3 +135,213 @@ def test_source_is_public() -> None:
     event = parser._parse_line(line)
     assert event is not None
     assert event.source_is_public is False
+
+
+def test_parse_icmp_error_line() -> None:
+    """Test that the packet embedded in an ICMP error does not override the outer fields."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    line = "Jun 15 12:34:56 hostname kernel: [12345.678901] UFW BLOCK IN=eth0 OUT= MAC=aa:bb:cc:dd:ee:ff SRC=8.8.8.8 DST=192.168.1.1 LEN=88 TOS=0x00 PREC=0xC0 TTL=64 ID=5555 PROTO=ICMP TYPE=3 CODE=3 [SRC=192.168.1.1 DST=1.2.3.4 LEN=60 TOS=0x00 PREC=0x00 TTL=64 ID=1234 PROTO=UDP SPT=53 DPT=4444 LEN=40 ]"
+    event = parser._parse_line(line)
+
+    assert event is not None
+    assert event.source_ip == "8.8.8.8"
+    assert event.destination_ip == "192.168.1.1"
+    assert event.protocol == "ICMP"
+    assert event.source_port is None
+    assert event.destination_port is None
+    assert event.destination_is_public is False
+
+
+def test_parse_corrupted_ports() -> None:
+    """Test that non-numeric ports are ignored instead of aborting the parse."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    line = "Jun 15 12:34:56 hostname kernel: [12345.678901] UFW BLOCK IN=eth0 OUT= SRC=8.8.8.8 DST=192.168.1.1 PROTO=TCP SPT=12a45 DPT=\u00b2"
+    event = parser._parse_line(line)
+
+    assert event is not None
+    assert event.source_port is None
+    assert event.destination_port is None
+
+
+def test_parse_bracketed_audit_line() -> None:
+    """Test parsing a journal-style line with a bracketed event type."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    line = "2025-06-22T15:09:26.640097-07:00 hostname kernel: [UFW AUDIT] IN= OUT=lo SRC=127.0.0.1 DST=224.0.0.251 LEN=235 TOS=0x00 PREC=0x00 TTL=255 ID=42643 DF PROTO=UDP SPT=5353 DPT=5353 LEN=215"
+    event = parser._parse_line(line)
+
+    assert event is not None
+    assert event.event_type == UFWEventType.AUDIT
+    assert event.source_ip == "127.0.0.1"
+    assert event.destination_ip == "224.0.0.251"
+    assert event.source_port == 5353
+    assert event.destination_port == 5353
+    assert event.protocol == "UDP"
+    assert event.interface is None
+
+
+def test_parse_ipv6_line() -> None:
+    """Test that expanded IPv6 addresses are normalized to the compressed form."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    line = "Jun 15 12:34:56 hostname kernel: [12345.678901] UFW BLOCK IN=eth0 OUT= MAC=aa:bb:cc:dd:ee:ff SRC=2001:4860:4860:0000:0000:0000:0000:8888 DST=fe80:0000:0000:0000:0202:b3ff:fe1e:8329 LEN=60 TC=0 HOPLIMIT=64 FLOWLBL=0 PROTO=TCP SPT=12345 DPT=80 WINDOW=65535 RES=0x00 SYN URGP=0"
+    event = parser._parse_line(line)
+
+    assert event is not None
+    assert event.source_ip == "2001:4860:4860::8888"
+    assert event.destination_ip == "fe80::202:b3ff:fe1e:8329"
+    assert event.source_is_public is True
+    assert event.destination_is_public is False
+
+
+def test_parse_parallel_matches_parse() -> None:
+    """Test that parallel parsing returns the same events in the same order."""
+    log_file = os.path.join(os.path.dirname(__file__), "sample_ufw.log")
+    parser = UFWLogParser(log_file)
+
+    expected = [event.raw_log for event in parser.parse()]
+    events = parser.parse_parallel(n_workers=3)
+
+    assert [event.raw_log for event in events] == expected
+
+    # A single worker falls back to parsing in this process
+    events = parser.parse_parallel(n_workers=1)
+
+    assert [event.raw_log for event in events] == expected
+
+
+def test_deduplicate_by_ip() -> None:
+    """Test counting public addresses while keeping the first event for each."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+    first = parser._parse_line("Jun 15 12:34:56 hostname kernel: [1.0] UFW BLOCK IN=eth0 OUT= SRC=8.8.8.8 DST=192.168.1.1 PROTO=TCP SPT=12345 DPT=80")
+    second = parser._parse_line("Jun 15 12:35:56 hostname kernel: [2.0] UFW ALLOW IN= OUT=eth0 SRC=192.168.1.1 DST=8.8.8.8 PROTO=UDP SPT=5353 DPT=53")
+    parser.events = [first, second]
+
+    assert parser.deduplicate_by_ip() == {"8.8.8.8": (2, first)}
+
+
+def test_parse_pipe() -> None:
+    """Test that logs read from a pipe are parsed like regular files."""
+    log_file = os.path.join(os.path.dirname(__file__), "sample_ufw.log")
+    parser = UFWLogParser(log_file)
+    expected = [event.raw_log for event in parser.parse()]
+
+    read_fd, write_fd = os.pipe()
+    with open(log_file, "rb") as log, os.fdopen(write_fd, "wb") as writer:
+        writer.write(log.read())
+    with os.fdopen(read_fd, "rb") as reader:
+        events = list(parser._iter_file_range(reader))
+
+    assert [event.raw_log for event in events] == expected
+
+
+def test_summarize_matches_separate_passes() -> None:
+    """Test that summarize agrees with group_by_event_type and deduplicate_by_ip."""
+    log_file = os.path.join(os.path.dirname(__file__), "sample_ufw.log")
+    parser = UFWLogParser(log_file)
+    parser.parse()
+
+    by_type, ip_counts = parser.summarize()
+
+    assert by_type == parser.group_by_event_type()
+    assert ip_counts == parser.deduplicate_by_ip()
+
+
+def test_is_public_ipv4_ranges() -> None:
+    """Test IPv4 classification at the edges of non-public ranges."""
+    assert _is_public_ip("8.8.8.8") is True
+    assert _is_public_ip("9.255.255.255") is True
+    assert _is_public_ip("10.0.0.0") is False
+    assert _is_public_ip("10.255.255.255") is False
+    assert _is_public_ip("11.0.0.0") is True
+    assert _is_public_ip("172.15.255.255") is True
+    assert _is_public_ip("172.31.255.255") is False
+    assert _is_public_ip("224.0.0.251") is False
+    assert _is_public_ip("255.255.255.255") is False
+    assert _is_public_ip("300.1.1.1") is False
+    assert _is_public_ip("010.0.0.1") is False
+    assert _is_public_ip("0x8.8.8.8") is False
+
+
+def test_is_public_ipv6() -> None:
+    """Test IPv6 classification of the expanded addresses UFW logs."""
+    assert _is_public_ip("2001:4860:4860:0000:0000:0000:0000:8888") is True
+    assert _is_public_ip("0000:0000:0000:0000:0000:0000:0000:0001") is False
+    assert _is_public_ip("fe80:0000:0000:0000:0202:b3ff:fe1e:8329") is False
+    assert _is_public_ip("ff02:0000:0000:0000:0000:0000:0000:00fb") is False
+    assert _is_public_ip("not-an-ip") is False
+
+
+def test_parser_is_public_ip() -> None:
+    """Test that UFWLogParser.is_public_ip agrees with the fast classifier."""
+    parser = UFWLogParser("")  # Empty string for testing individual lines
+
+    for ip_str in ("8.8.8.8", "192.168.1.1", "239.255.255.250", "2001:4860:4860::8888", "::1", "::"):
+        assert parser.is_public_ip(ip_str) is _is_public_ip(ip_str)
+    assert parser.is_public_ip("") is False
+
+
+class FakeAnswer(list):
+    """Minimal stand-in for a dnspython reverse lookup answer."""
+
+    class rrset:
+        ttl = 3600
+
+
+class FakeAnswerWithoutRRset(list):
+    """Answer whose rrset is missing, which dnspython's types allow."""
+
+    rrset = None
+
+
+def fake_resolve_address(ip_addr: str) -> FakeAnswer:
+    """Resolve only 8.8.8.8, like a reverse zone with a single PTR record.
+
+    Lookups for 9.9.9.9 time out; every other address has no PTR record.
+    """
+    if ip_addr == "8.8.8.8":
+        return FakeAnswer(["dns.google."])
+    if ip_addr == "9.9.9.9":
+        raise dns.resolver.LifetimeTimeout()
+    raise dns.resolver.NXDOMAIN()
+
+
+def test_resolve_domains() -> None:
+    """Test bulk reverse DNS resolution with the resolver patched out."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        parser = UFWLogParser("", os.path.join(temp_dir, "dns_cache.json"))
+
+        with patch("dns.resolver.resolve_address", side_effect=fake_resolve_address) as resolver:
+            domains = parser.resolve_domains(["8.8.8.8", "1.2.3.4", "192.168.1.1", "8.8.8.8"])
+
+        assert domains == {"8.8.8.8": "dns.google", "1.2.3.4": "1.2.3.4", "192.168.1.1": "192.168.1.1"}
+        # Private addresses are never sent to the resolver
+        assert resolver.call_count == 2
+
+
+def test_resolve_domains_uses_saved_cache() -> None:
+    """Test that names and missing PTR records are reused by a new parser instance."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dns_cache_file = os.path.join(temp_dir, "dns_cache.json")
+        ip_list = ["8.8.8.8", "1.2.3.4", "9.9.9.9"]
+
+        with patch("dns.resolver.resolve_address", side_effect=fake_resolve_address):
+            UFWLogParser("", dns_cache_file).resolve_domains(ip_list)
+
+        with patch("dns.resolver.resolve_address", side_effect=fake_resolve_address) as resolver:
+            domains = UFWLogParser("", dns_cache_file).resolve_domains(ip_list)
+
+        assert domains == {"8.8.8.8": "dns.google", "1.2.3.4": "1.2.3.4", "9.9.9.9": "9.9.9.9"}
+        # Only the lookup that timed out is retried
+        assert [call.args[0] for call in resolver.call_args_list] == ["9.9.9.9"]
+
+
+def test_resolve_domain_without_rrset() -> None:
+    """Test that an answer without an rrset is cached with the configured TTL."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        parser = UFWLogParser("", os.path.join(temp_dir, "dns_cache.json"))
+
+        with patch("dns.resolver.resolve_address", return_value=FakeAnswerWithoutRRset(["dns.google."])):
+            assert parser.resolve_domain("8.8.8.8") == "dns.google"
+
+        # resolve_domain saves the result without a call to resolve_domains
+        reloaded = UFWLogParser("", parser.dns_cache_file)
+        assert dict(reloaded._load_saved_dns().items()) == {"8.8.8.8": "dns.google"}
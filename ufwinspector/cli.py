@@ -2,18 +2,27 @@
 
 import os
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
 
 from ufwinspector import __version__
 from ufwinspector.config import config
-from ufwinspector.core.analyzer import UFWLogAnalyzer
-from ufwinspector.ui.console import ConsoleUI
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(help="UFWInspector - UFW log analyzer for security monitoring")
-console = Console()
+
+
+@lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
 
 # Create a subcommand group for configuration
 config_app = typer.Typer(help="Configuration commands")
@@ -25,6 +34,7 @@ def config_get(
     key: str = typer.Argument(..., help="Configuration key to get")
 ) -> None:
     """Get a configuration value."""
+    console = _get_console()
     value = config.get(key)
     if value is None:
         console.print(f"[yellow]Configuration key '{key}' not found[/yellow]")
@@ -38,6 +48,7 @@ def config_set(
     value: str = typer.Argument(..., help="Value to set")
 ) -> None:
     """Set a configuration value."""
+    console = _get_console()
     # Handle special cases for type conversion
     if key == "max_entries":
         try:
@@ -55,12 +66,14 @@ def config_set(
             return
     
     config.set(key, value)
+    config.flush()
     console.print(f"[green]Configuration updated: {key} = {value}[/green]")
 
 
 @config_app.command("list")
 def config_list() -> None:
     """List all configuration values."""
+    console = _get_console()
     console.print("[bold]UFWInspector Configuration[/bold]")
     for key, value in config.config.items():
         console.print(f"{key} = {value}")
@@ -69,7 +82,9 @@ def config_list() -> None:
 @config_app.command("reset")
 def config_reset() -> None:
     """Reset configuration to defaults."""
+    console = _get_console()
     config.reset()
+    config.flush()
     console.print("[green]Configuration reset to defaults[/green]")
     config_list()
 
@@ -107,6 +122,7 @@ def analyze(
     )
 ) -> None:
     """Analyze UFW logs and display results."""
+    console = _get_console()
     # Get log file path from config if not provided
     if log_file is None:
         log_file = config.get("log_file")
@@ -145,18 +161,17 @@ def analyze(
         
         # Continue with normal analysis
     
+    # Imported here so other commands don't pay for the analysis stack
+    from ufwinspector.core.analyzer import UFWLogAnalyzer
+    from ufwinspector.ui.console import ConsoleUI
+    
     analyzer = UFWLogAnalyzer(log_file)
     ip_summaries = analyzer.analyze()
     
     if debug:
-        console.print(f"[yellow]Debug: Found {len(analyzer.events)} total events[/yellow]")
-        public_ips = set()
-        for event in analyzer.events:
-            if event.source_ip and event.source_is_public:
-                public_ips.add(event.source_ip)
-            if event.destination_ip and event.destination_is_public:
-                public_ips.add(event.destination_ip)
-        console.print(f"[yellow]Debug: Found {len(public_ips)} unique public IPs: {', '.join(list(public_ips)[:10])}{'...' if len(public_ips) > 10 else ''}[/yellow]")
+        console.print(f"[yellow]Debug: Found {analyzer.event_count} total events[/yellow]")
+        public_ips = [summary.ip_address for summary in ip_summaries]
+        console.print(f"[yellow]Debug: Found {len(public_ips)} unique public IPs: {', '.join(public_ips[:10])}{'...' if len(public_ips) > 10 else ''}[/yellow]")
     
     ui = ConsoleUI()
     
@@ -170,17 +185,10 @@ def analyze(
         ui.display_summary(ip_summaries)
 
 
-@app.command()
-def version() -> None:
-    """Show the version of CozyGuard."""
-    console.print(f"[bold]CozyGuard[/bold] version {__version__}")
-    console.print(f"Configuration file: {config.config_file}")
-    console.print(f"Log file: {config.get('log_file')}")
-
-
 @app.command()
 def version() -> None:
     """Show version information."""
+    console = _get_console()
     console.print(f"[bold]UFWInspector[/bold] version {__version__}")
     console.print(f"Configuration file: {config.config_file}")
     console.print(f"Default log file: {config.get('log_file')}")
@@ -1,5 +1,6 @@
 """Configuration management for UFWInspector."""
 
+import atexit
 import os
 import json
 from pathlib import Path
@@ -21,7 +22,10 @@ class Config:
         self.config_dir = os.path.expanduser("~/.config/ufwinspector")
         self.config_file = os.path.join(self.config_dir, "config.json")
         self.config = self.DEFAULT_CONFIG.copy()
+        self._dirty = False
         self._load_config()
+        # Pending changes are written once, when the interpreter exits
+        atexit.register(self.flush)
 
     def _load_config(self) -> None:
         """Load configuration from file."""
@@ -49,6 +53,12 @@ class Config:
         except Exception as e:
             print(f"Error saving configuration: {e}")
 
+    def flush(self) -> None:
+        """Save configuration to file if it has unsaved changes."""
+        if self._dirty:
+            self.save_config()
+            self._dirty = False
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self.config.get(key, default)
@@ -56,17 +66,17 @@ class Config:
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
         self.config[key] = value
-        self.save_config()
+        self._dirty = True
 
     def update(self, config_dict: Dict[str, Any]) -> None:
         """Update multiple configuration values."""
         self.config.update(config_dict)
-        self.save_config()
+        self._dirty = True
 
     def reset(self) -> None:
         """Reset configuration to defaults."""
         self.config = self.DEFAULT_CONFIG.copy()
-        self.save_config()
+        self._dirty = True
 
 
 # Global configuration instance
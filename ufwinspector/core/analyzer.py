@@ -1,14 +1,25 @@
 """UFW log analyzer module."""
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..config import config
-from .parser import UFWEvent, UFWEventType, UFWLogParser
+from .parser import DATACLASS_SLOTS, UFWEvent, UFWEventType, UFWLogParser
 from .geo import IPInfoLookup
 
+# Display and sort order of IPSummary.direction_type values
+DIRECTION_RANK = {"Incoming": 0, "Bidirectional": 1, "Outgoing": 2}
 
-@dataclass
+# (IP address, is source, event type, protocol, port) seen in one event
+Observation = Tuple[str, bool, UFWEventType, Optional[str], Optional[int]]
+
+# Number of times each observation was seen; a Counter when built here
+ObservationCounts = Dict[Observation, int]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class IPSummary:
     """Summary information for an IP address."""
 
@@ -20,21 +31,27 @@ class IPSummary:
     is_destination: bool
     source_count: int  # Count of events where this IP is the source
     destination_count: int  # Count of events where this IP is the destination
-    event_types: List[UFWEventType]
-    source_event_types: List[UFWEventType]  # Event types where this IP is the source
-    destination_event_types: List[UFWEventType]  # Event types where this IP is the destination
-    protocols: List[str]
-    ports: List[int]
+    event_types: Set[UFWEventType]
+    source_event_types: Set[UFWEventType]  # Event types where this IP is the source
+    destination_event_types: Set[UFWEventType]  # Event types where this IP is the destination
+    protocols: Set[str]
+    ports: Set[int]
+    direction_type: str = ""  # Incoming, Outgoing or Bidirectional
+    _sort_key: Tuple[int, int] = field(init=False, default=(0, 0), repr=False, compare=False)
     
-    @property
-    def direction_type(self) -> str:
-        """Return a categorized direction type for sorting and display."""
+    def __post_init__(self) -> None:
+        """Derive the direction type when it is not given explicitly."""
+        if not self.direction_type:
+            self.update_direction_type()
+    
+    def update_direction_type(self) -> None:
+        """Recompute the direction type from the source/destination flags."""
         if self.is_source and not self.is_destination:
-            return "Incoming"  # External IP trying to connect to us
+            self.direction_type = "Incoming"  # External IP trying to connect to us
         elif self.is_destination and not self.is_source:
-            return "Outgoing"  # We're connecting to external IP
+            self.direction_type = "Outgoing"  # We're connecting to external IP
         else:
-            return "Bidirectional"  # Both directions seen
+            self.direction_type = "Bidirectional"  # Both directions seen
 
 
 class UFWLogAnalyzer:
@@ -48,117 +65,157 @@ class UFWLogAnalyzer:
         
         self.parser = UFWLogParser(log_file_path)
         self.ip_lookup = IPInfoLookup()
-        self.events: List[UFWEvent] = []
+        self.event_count = 0
         self.ip_summaries: List[IPSummary] = []
 
     def analyze(self) -> List[IPSummary]:
         """Analyze the UFW logs and return IP summaries."""
-        self.events = self.parser.parse()
-        self._generate_ip_summaries()
+        # Events are reduced to observation counts as they are parsed and
+        # never stored as a whole
+        observations: ObservationCounts
+        n_workers = self.parser._parallel_workers()
+        if self.parser._prefers_parallel() and n_workers > 1:
+            # Each worker counts its own chunk, so only the compact counts,
+            # not the events, are sent back to this process
+            merged: Counter[Observation] = Counter()
+            self.event_count = 0
+            for event_count, chunk_observations in self.parser._map_chunks(
+                _count_chunk_observations, n_workers
+            ):
+                self.event_count += event_count
+                merged.update(chunk_observations)
+            observations = merged
+        else:
+            self.event_count, observations = _count_observations(self.parser._iter_events())
+        
+        self._generate_ip_summaries(observations)
         return self.ip_summaries
 
-    def _generate_ip_summaries(self) -> None:
-        """Generate summaries for each unique IP address."""
+    def _generate_ip_summaries(self, observations: ObservationCounts) -> None:
+        """Generate summaries for each unique IP address from observation counts."""
         ip_data: Dict[str, IPSummary] = {}
         
-        for event in self.events:
-            # Process source IP if it's public
-            if event.source_ip and event.source_is_public:
-                self._process_ip(
-                    ip_data, 
-                    event.source_ip, 
-                    event, 
-                    is_source=True, 
-                    is_destination=False
-                )
-            
-            # Process destination IP if it's public
-            if event.destination_ip and event.destination_is_public:
-                self._process_ip(
-                    ip_data, 
-                    event.destination_ip, 
-                    event, 
-                    is_source=False, 
-                    is_destination=True
-                )
+        # Identical observations were counted up front, leaving only one
+        # summary update per distinct (IP, direction, event type, protocol,
+        # port) combination
+        for (ip_address, is_source, event_type, protocol, port), count in observations.items():
+            self._process_ip(ip_data, ip_address, is_source, event_type, protocol, port, count)
         
-        # Convert to list and sort by direction type (incoming first) and then by count
-        self.ip_summaries = sorted(
-            ip_data.values(), 
-            key=lambda x: (
-                0 if x.direction_type == "Incoming" else 
-                1 if x.direction_type == "Bidirectional" else 2,
-                -x.count  # Negative for descending order
+        self._resolve_names(ip_data)
+        
+        # Sort by direction type (incoming first) and then by count, using a
+        # key computed once per summary
+        for summary in ip_data.values():
+            summary.update_direction_type()
+            summary._sort_key = (
+                DIRECTION_RANK[summary.direction_type],
+                -summary.count  # Negative for descending order
             )
-        )
+        
+        self.ip_summaries = sorted(ip_data.values(), key=attrgetter("_sort_key"))
 
     def _process_ip(
         self, 
         ip_data: Dict[str, IPSummary], 
         ip_address: str, 
-        event: UFWEvent, 
         is_source: bool, 
-        is_destination: bool
+        event_type: UFWEventType, 
+        protocol: Optional[str], 
+        port: Optional[int], 
+        count: int
     ) -> None:
-        """Process an IP address and update its summary."""
-        if ip_address not in ip_data:
-            domain_name = self.parser.resolve_domain(ip_address)
-            
-            # Get ISP information if domain is same as IP (unresolved)
-            isp = "Unknown"
-            if domain_name == ip_address:
-                try:
-                    isp = self.ip_lookup.get_isp(ip_address)
-                except Exception:
-                    pass
-            
-            ip_data[ip_address] = IPSummary(
+        """Add count occurrences of an observation to the IP address summary."""
+        summary = ip_data.get(ip_address)
+        if summary is None:
+            # Domain name and ISP are filled in by _resolve_names once all
+            # unique addresses are known
+            summary = ip_data[ip_address] = IPSummary(
                 ip_address=ip_address,
-                domain_name=domain_name,
-                isp=isp,
-                count=1,
-                is_source=is_source,
-                is_destination=is_destination,
-                source_count=1 if is_source else 0,
-                destination_count=1 if is_destination else 0,
-                event_types=[event.event_type],
-                source_event_types=[event.event_type] if is_source else [],
-                destination_event_types=[event.event_type] if is_destination else [],
-                protocols=[event.protocol] if event.protocol else [],
-                ports=[]
+                domain_name=ip_address,
+                isp="Unknown",
+                count=0,
+                is_source=False,
+                is_destination=False,
+                source_count=0,
+                destination_count=0,
+                event_types=set(),
+                source_event_types=set(),
+                destination_event_types=set(),
+                protocols=set(),
+                ports=set()
             )
-            
-            # Add relevant ports
-            if is_source and event.source_port:
-                ip_data[ip_address].ports.append(event.source_port)
-            if is_destination and event.destination_port:
-                ip_data[ip_address].ports.append(event.destination_port)
+        
+        summary.count += count
+        summary.event_types.add(event_type)
+        
+        # Update direction-specific counts
+        if is_source:
+            summary.is_source = True
+            summary.source_count += count
+            summary.source_event_types.add(event_type)
         else:
-            # Update existing summary
-            summary = ip_data[ip_address]
-            summary.count += 1
-            summary.is_source = summary.is_source or is_source
-            summary.is_destination = summary.is_destination or is_destination
-            
-            # Update direction-specific counts
-            if is_source:
-                summary.source_count += 1
-                if event.event_type not in summary.source_event_types:
-                    summary.source_event_types.append(event.event_type)
-            
-            if is_destination:
-                summary.destination_count += 1
-                if event.event_type not in summary.destination_event_types:
-                    summary.destination_event_types.append(event.event_type)
-            
-            if event.event_type not in summary.event_types:
-                summary.event_types.append(event.event_type)
-            
-            if event.protocol and event.protocol not in summary.protocols:
-                summary.protocols.append(event.protocol)
+            summary.is_destination = True
+            summary.destination_count += count
+            summary.destination_event_types.add(event_type)
+        
+        if protocol:
+            summary.protocols.add(protocol)
+        
+        # Add the port relevant to this direction
+        if port:
+            summary.ports.add(port)
+
+    def _resolve_names(self, ip_data: Dict[str, IPSummary]) -> None:
+        """Resolve domain names and ISPs for all summarized IP addresses."""
+        domain_names = self.parser.resolve_domains(ip_data)
+        
+        unresolved = []
+        for ip_address, domain_name in domain_names.items():
+            ip_data[ip_address].domain_name = domain_name
+            if domain_name == ip_address:
+                unresolved.append(ip_address)
+        
+        # Get ISP information for addresses without a domain name in one go
+        self.ip_lookup.get_bulk(unresolved)
+        
+        for ip_address in unresolved:
+            try:
+                ip_data[ip_address].isp = self.ip_lookup.get_isp(ip_address)
+            except Exception:
+                pass
+
+
+def _count_observations(events: Iterable[UFWEvent]) -> Tuple[int, ObservationCounts]:
+    """Count identical observations and the number of events they came from.
+
+    Counter does the per-event bookkeeping in C; only the generator below
+    runs Python code for each event.
+    """
+    event_count = 0
+
+    def observations() -> Iterator[Observation]:
+        nonlocal event_count
+        for event in events:
+            event_count += 1
             
-            if is_source and event.source_port and event.source_port not in summary.ports:
-                summary.ports.append(event.source_port)
+            # Source IP if it's public
+            source_ip = event.source_ip
+            if source_ip and event.source_is_public:
+                yield (source_ip, True, event.event_type, event.protocol, event.source_port)
             
-            if is_destination and event.destination_port and event.destination_port not in summary.ports:
-                summary.ports.append(event.destination_port)
+            # Destination IP if it's public
+            destination_ip = event.destination_ip
+            if destination_ip and event.destination_is_public:
+                yield (destination_ip, False, event.event_type, event.protocol, event.destination_port)
+
+    counts = Counter(observations())
+    return event_count, counts
+
+
+def _count_chunk_observations(
+    log_file_path: str, start: int, end: int
+) -> Tuple[int, ObservationCounts]:
+    """Count the observations in the lines of a log file that start within a byte range."""
+    parser = UFWLogParser(log_file_path)
+    with open(log_file_path, "rb") as file:
+        return _count_observations(parser._iter_file_range(file, start, end))
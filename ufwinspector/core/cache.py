@@ -0,0 +1,67 @@
+"""On-disk cache for network lookups."""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, Tuple
+
+
+class PersistentCache:
+    """JSON file backed key/value cache whose entries expire after a TTL."""
+
+    def __init__(self, cache_file: str) -> None:
+        """Initialize the cache and load unexpired entries from cache_file."""
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load unexpired entries saved by previous runs."""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(saved, dict):
+            return
+
+        now = time.time()
+        for key, entry in saved.items():
+            if (
+                isinstance(entry, dict)
+                and "value" in entry
+                and entry.get("expires_at", 0) > now
+            ):
+                self.entries[key] = entry
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the cached keys and values."""
+        for key, entry in self.entries.items():
+            yield key, entry["value"]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value that expires after ttl seconds."""
+        self.entries[key] = {"value": value, "expires_at": time.time() + ttl}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if there are unsaved entries.
+
+        The file is replaced atomically so an interrupted run never leaves a
+        truncated cache behind. Write errors are ignored; the cache is only
+        an optimization.
+        """
+        if not self._dirty:
+            return
+
+        temp_file = f"{self.cache_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(temp_file, self.cache_file)
+            self._dirty = False
+        except OSError:
+            pass
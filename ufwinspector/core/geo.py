@@ -1,51 +1,148 @@
 """IP geolocation and ISP lookup functionality."""
 
 import json
+import os
 import time
-from typing import Dict, Optional
+import urllib.error
+from typing import Dict, Iterable, List, Optional
 import urllib.request
 
+from ..config import config
+from .cache import PersistentCache
+
 
 class IPInfoLookup:
     """Class for looking up IP address information."""
 
-    def __init__(self) -> None:
+    API_URL = "https://ipinfo.io"
+    BATCH_SIZE = 100  # Maximum number of IPs sent in a single batch request
+    MIN_REQUEST_INTERVAL = 1  # Minimum seconds between single lookups to avoid rate limiting
+    USER_AGENT = "CozyGuard/0.1.0 (https://github.com/example/cozyguard)"
+
+    def __init__(self, cache_file: Optional[str] = None) -> None:
         """Initialize the IP info lookup."""
-        self.cache: Dict[str, Dict] = {}
-        self.last_request_time = 0
-        self.min_request_interval = 1  # Minimum seconds between API requests to avoid rate limiting
+        if cache_file is None:
+            cache_file = os.path.join(config.config_dir, "ipinfo_cache.json")
+
+        self.cache_file = cache_file
+        self._saved = PersistentCache(cache_file)
+        self.last_request_time = 0.0
+
+        # Successful lookups saved by previous runs
+        self.cache: Dict[str, Dict] = {
+            ip_address: data
+            for ip_address, data in self._saved.items()
+            if isinstance(data, dict) and "_parsed_isp" in data
+        }
+
+    def save_cache(self) -> None:
+        """Save successful lookups to the cache file."""
+        self._saved.save()
+
+    def _store(self, ip_address: str, data: Dict) -> None:
+        """Store a successful lookup in the cache with an expiry time."""
+        data["_parsed_isp"] = self._parse_isp(data)
+        self.cache[ip_address] = data
+        self._saved.set(ip_address, data, config.get("dns_cache_ttl", 86400))
 
     def get_ip_info(self, ip_address: str) -> Dict:
         """Get information about an IP address."""
         if ip_address in self.cache:
             return self.cache[ip_address]
 
+        data = self._lookup(ip_address)
+        self.save_cache()
+        return data
+
+    def _lookup(self, ip_address: str) -> Dict:
+        """Fetch information about a single IP address and cache it."""
         # Respect rate limits
-        current_time = time.time()
-        if current_time - self.last_request_time < self.min_request_interval:
-            time.sleep(self.min_request_interval - (current_time - self.last_request_time))
-        
+        elapsed = time.monotonic() - self.last_request_time
+        if elapsed < self.MIN_REQUEST_INTERVAL:
+            time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
+        self.last_request_time = time.monotonic()
+
         try:
             # Use ipinfo.io API (free tier, no API key required for basic lookups)
-            url = f"https://ipinfo.io/{ip_address}/json"
+            url = f"{self.API_URL}/{ip_address}/json"
             request = urllib.request.Request(
                 url,
-                headers={
-                    "User-Agent": "CozyGuard/0.1.0 (https://github.com/example/cozyguard)"
-                }
+                headers={"User-Agent": self.USER_AGENT}
             )
             
             with urllib.request.urlopen(request, timeout=3) as response:
                 data = json.loads(response.read().decode())
-                self.cache[ip_address] = data
-                self.last_request_time = time.time()
-                return data
+            self._store(ip_address, data)
+            return data
         except Exception as e:
             # Return minimal info on error
-            self.cache[ip_address] = {"ip": ip_address, "org": "Unknown", "error": str(e)}
+            self.cache[ip_address] = {
+                "ip": ip_address,
+                "org": "Unknown",
+                "error": str(e),
+                "_parsed_isp": "Unknown",
+            }
             return self.cache[ip_address]
 
+    def get_bulk(self, ip_addresses: Iterable[str]) -> None:
+        """Look up many IP addresses at once and store the results in the cache.
+
+        Addresses are sent to the ipinfo.io batch endpoint in groups of
+        BATCH_SIZE. If a batch request fails, its addresses are looked up
+        one by one instead, at most one every MIN_REQUEST_INTERVAL seconds.
+        Once the batch endpoint refuses access (it may require a token), the
+        remaining addresses go straight to single lookups.
+        """
+        pending = [ip for ip in dict.fromkeys(ip_addresses) if ip not in self.cache]
+        if not pending:
+            return
+
+        batch_allowed = True
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            batch = pending[start:start + self.BATCH_SIZE]
+            results: Dict[str, Dict] = {}
+            if batch_allowed:
+                try:
+                    results = self._fetch_batch(batch)
+                except urllib.error.HTTPError as e:
+                    batch_allowed = e.code not in (401, 403)
+                except Exception:
+                    pass
+
+            for ip in batch:
+                data = results.get(ip)
+                if isinstance(data, dict):
+                    self._store(ip, data)
+                else:
+                    self._lookup(ip)
+
+        self.save_cache()
+
+    def _fetch_batch(self, ip_addresses: List[str]) -> Dict[str, Dict]:
+        """Fetch information for a list of IP addresses in one request."""
+        request = urllib.request.Request(
+            f"{self.API_URL}/batch",
+            data=json.dumps(ip_addresses).encode(),
+            headers={
+                "User-Agent": self.USER_AGENT,
+                "Content-Type": "application/json",
+            },
+            method="POST",
+        )
+
+        with urllib.request.urlopen(request, timeout=10) as response:
+            result = json.loads(response.read().decode())
+
+        # Error responses are not keyed by IP address; treat them as empty so
+        # every address falls back to a single lookup
+        return result if isinstance(result, dict) else {}
+
+    @staticmethod
+    def _parse_isp(info: Dict) -> str:
+        """Extract the ISP name from the "org" field, dropping the AS number."""
+        org: str = info.get("org", "Unknown")
+        return org.split(" ", 1)[1] if " " in org else org
+
     def get_isp(self, ip_address: str) -> str:
         """Get the ISP name for an IP address."""
-        info = self.get_ip_info(ip_address)
-        return info.get("org", "Unknown").split(" ", 1)[1] if " " in info.get("org", "Unknown") else info.get("org", "Unknown")
+        return self.get_ip_info(ip_address)["_parsed_isp"]
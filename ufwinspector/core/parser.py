@@ -1,16 +1,134 @@
 """UFW log parser module."""
 
+import mmap
+import os
 import re
+import socket
+import stat
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
-from ipaddress import IPv4Address, IPv6Address, ip_address
-from typing import Dict, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+from typing import BinaryIO, Callable, DefaultDict, Dict, Iterable, Iterator, List, Match, Optional, Set, Tuple, TypeVar, Union
 
 import dns.resolver
 from dns.exception import DNSException
 
 from ..config import config
+from .cache import PersistentCache
+
+# @dataclass keyword arguments shared by the event and summary classes.
+# Slotted dataclasses drop the per-instance __dict__, which matters for the
+# number of events and summaries we create. slots=True needs Python 3.10.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Logs larger than this are parsed across several processes
+PARALLEL_PARSE_THRESHOLD = 4 * 1024 * 1024
+
+# Result of a function applied to one byte range of the log by _map_chunks
+_ChunkResult = TypeVar("_ChunkResult")
+
+# Number of reverse DNS lookups performed concurrently by resolve_domains
+DNS_WORKERS = 64
+
+# Token used to locate UFW entries without regular expressions
+_UFW_TOKEN = "UFW "
+_UFW_TOKEN_BYTES = _UFW_TOKEN.encode()
+
+# Timestamp prefixes, compiled once. Support both traditional syslog and
+# systemd journal (ISO 8601) formats.
+_TIMESTAMP_ISO_RE = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+[+-]\d{2}:\d{2})")
+_TIMESTAMP_SYSLOG_RE = re.compile(r"(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})")
+
+# Syslog month abbreviations, which are always in English
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# IPv4 ranges that are private, loopback, link-local, multicast or otherwise
+# reserved, as sorted (start, end) integer bounds for a bisect lookup
+_NON_PUBLIC_IPV4 = sorted(
+    (int(net.network_address), int(net.broadcast_address))
+    for net in map(ip_network, (
+        "0.0.0.0/8",
+        "10.0.0.0/8",
+        "127.0.0.0/8",
+        "169.254.0.0/16",
+        "172.16.0.0/12",
+        "192.0.0.0/29",
+        "192.0.0.170/31",
+        "192.0.2.0/24",
+        "192.168.0.0/16",
+        "198.18.0.0/15",
+        "198.51.100.0/24",
+        "203.0.113.0/24",
+        "224.0.0.0/4",
+        "240.0.0.0/4",
+    ))
+)
+_NON_PUBLIC_IPV4_STARTS = [start for start, _ in _NON_PUBLIC_IPV4]
+_NON_PUBLIC_IPV4_ENDS = [end for _, end in _NON_PUBLIC_IPV4]
+
+
+@lru_cache(maxsize=1 << 16)
+def _is_public_ip(ip_str: str) -> bool:
+    """Check if an IP address is public."""
+    if ip_str.count(".") == 3:
+        try:
+            packed = socket.inet_aton(ip_str)
+        except OSError:
+            return False
+        # inet_aton also accepts octal and hex parts ("010.0.0.1",
+        # "0x8.8.8.8"); only canonical dotted quads are valid addresses
+        if socket.inet_ntoa(packed) != ip_str:
+            return False
+        value = int.from_bytes(packed, "big")
+        i = bisect_right(_NON_PUBLIC_IPV4_STARTS, value) - 1
+        return i < 0 or value > _NON_PUBLIC_IPV4_ENDS[i]
+
+    # ip_address() accepts IPv6 in both the expanded form UFW logs
+    # (0000:...:0001) and the compressed form
+    try:
+        ip = ip_address(ip_str)
+    except ValueError:
+        return False
+    return not (ip.is_private or ip.is_loopback or ip.is_link_local or
+                ip.is_multicast or ip.is_unspecified or ip.is_reserved)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_ip(value: str) -> str:
+    """Normalize an IP address taken from a SRC/DST field.
+
+    UFW logs IPv6 addresses fully expanded (0000:...:0001); they are
+    converted to the canonical compressed form. IPv4 addresses and values
+    that do not parse are returned unchanged. The result is interned so
+    events for the same address share one string, even past the cache size.
+    """
+    # IPv6 needs at least two colons
+    if value.count(":") >= 2:
+        try:
+            value = str(ip_address(value))
+        except ValueError:
+            pass
+    return sys.intern(value)
+
+
+def _parse_syslog_timestamp(timestamp_str: str, year: int) -> datetime:
+    """Parse a syslog timestamp such as "Jun  5 12:34:56".
+
+    The format is fixed, so splitting it by hand is much cheaper than
+    strptime. Raises KeyError or ValueError for invalid timestamps.
+    """
+    month, day, clock = timestamp_str.split()
+    hour, minute, second = clock.split(":")
+    return datetime(year, _MONTHS[month], int(day), int(hour), int(minute), int(second))
 
 
 class UFWEventType(Enum):
@@ -22,9 +140,46 @@ class UFWEventType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+def _classify_event_type(line: str, idx: int) -> UFWEventType:
+    """Classify the event from the characters following the UFW token at idx."""
+    # BLOCK, ALLOW and AUDIT differ within their first two characters
+    pos = idx + len(_UFW_TOKEN)
+    first = line[pos:pos + 1]
+    if first == "B":
+        return UFWEventType.BLOCK
+    if first == "A":
+        second = line[pos + 1:pos + 2]
+        if second == "L":
+            return UFWEventType.ALLOW
+        if second == "U":
+            return UFWEventType.AUDIT
+    return UFWEventType.UNKNOWN
+
+
+def _split_fields(text: str) -> Dict[str, str]:
+    """Split space separated KEY=VALUE tokens into a dict.
+
+    Tokens without "=" (flags such as DF or SYN) map to an empty string.
+    Splitting stops at the packet that ICMP error messages embed as
+    "[SRC=... DST=... PROTO=...]", and the first value of any other
+    repeated key (such as the UDP LEN) wins, so the outer packet's fields
+    are never overwritten.
+    """
+    fields: Dict[str, str] = {}
+    for token in text.split():
+        if token.startswith("["):
+            break
+        key, _, value = token.partition("=")
+        fields.setdefault(key, value)
+    return fields
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class UFWEvent:
-    """Represents a UFW log event."""
+    """Represents a UFW log event.
+
+    Events are immutable once parsed, which also makes them hashable.
+    """
 
     timestamp: datetime
     event_type: UFWEventType
@@ -35,152 +190,267 @@ class UFWEvent:
     protocol: Optional[str]
     interface: Optional[str]
     raw_log: str
+    # Classified once when the line is parsed
+    source_is_public: bool = False
+    destination_is_public: bool = False
 
-    @property
-    def source_is_public(self) -> bool:
-        """Check if source IP is public."""
-        if not self.source_ip:
-            return False
-        try:
-            # Handle IPv6 addresses in the format 0000:0000:0000:0000:0000:0000:0000:0001
-            ip_str = self.source_ip
-            if ":" in ip_str and not ip_str.startswith("["):
-                # Normalize IPv6 address format
-                ip_str = ip_str.replace("0000", "")
-                while "::" not in ip_str and ":::" not in ip_str:
-                    ip_str = ip_str.replace(":", "::", 1)
-                
-            ip = ip_address(ip_str)
-            return not (ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast)
-        except ValueError:
-            return False
 
-    @property
-    def destination_is_public(self) -> bool:
-        """Check if destination IP is public."""
-        if not self.destination_ip:
-            return False
-        try:
-            # Handle IPv6 addresses in the format 0000:0000:0000:0000:0000:0000:0000:0001
-            ip_str = self.destination_ip
-            if ":" in ip_str and not ip_str.startswith("["):
-                # Normalize IPv6 address format
-                ip_str = ip_str.replace("0000", "")
-                while "::" not in ip_str and ":::" not in ip_str:
-                    ip_str = ip_str.replace(":", "::", 1)
-                
-            ip = ip_address(ip_str)
-            return not (ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast)
-        except ValueError:
-            return False
+@dataclass(**DATACLASS_SLOTS)
+class _IPCount:
+    """Number of events seen for an IP address and the first of them."""
+
+    count: int
+    first_event: UFWEvent
+
+
+def _count_public_ips(ip_counts: Dict[str, _IPCount], event: UFWEvent) -> None:
+    """Count the public source and destination addresses of an event.
+
+    Entries are mutable, so counting a repeat occurrence takes a single
+    lookup and no tuple rebuilding.
+    """
+    source_ip = event.source_ip
+    if source_ip and event.source_is_public:
+        entry = ip_counts.get(source_ip)
+        if entry is None:
+            ip_counts[source_ip] = _IPCount(1, event)
+        else:
+            entry.count += 1
+
+    destination_ip = event.destination_ip
+    if destination_ip and event.destination_is_public:
+        entry = ip_counts.get(destination_ip)
+        if entry is None:
+            ip_counts[destination_ip] = _IPCount(1, event)
+        else:
+            entry.count += 1
+
+
+def _ip_count_tuples(ip_counts: Dict[str, _IPCount]) -> Dict[str, Tuple[int, UFWEvent]]:
+    """Convert per-IP entries to (count, first event) tuples."""
+    return {ip: (entry.count, entry.first_event) for ip, entry in ip_counts.items()}
 
 
 class UFWLogParser:
     """Parser for UFW log files."""
 
-    # Regular expressions for parsing UFW logs
-    # Support both traditional and systemd journal formats
-    TIMESTAMP_PATTERN_ISO = r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+[+-]\d{2}:\d{2})"
-    TIMESTAMP_PATTERN_SYSLOG = r"(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})"
-    EVENT_TYPE_PATTERN = r"UFW\s+(BLOCK|ALLOW|AUDIT)"  # Updated to match UFW AUDIT format without brackets
-    SRC_PATTERN = r"SRC=(\S+)"
-    DST_PATTERN = r"DST=(\S+)"
-    SPT_PATTERN = r"SPT=(\d+)"
-    DPT_PATTERN = r"DPT=(\d+)"
-    PROTO_PATTERN = r"PROTO=(\S+)"
-    IN_PATTERN = r"IN=(\S+)"
-
-    def __init__(self, log_file_path: Optional[str] = None) -> None:
+    def __init__(
+        self, log_file_path: Optional[str] = None, dns_cache_file: Optional[str] = None
+    ) -> None:
         """Initialize the parser with the log file path."""
         # Use provided log file path or get from config
         if log_file_path is None:
             log_file_path = config.get("log_file")
+        if dns_cache_file is None:
+            dns_cache_file = os.path.join(config.config_dir, "dns_cache.json")
             
         self.log_file_path = log_file_path
+        self.dns_cache_file = dns_cache_file
         self.events: List[UFWEvent] = []
         self.dns_cache: Dict[str, str] = {}
+        # Loaded on the first lookup so parsing alone never touches the file
+        self._saved_dns: Optional[PersistentCache] = None
+        # Syslog timestamps carry no year; look it up once, not per line
+        self._current_year = datetime.now().year
 
     def parse(self) -> List[UFWEvent]:
-        """Parse the UFW log file and return a list of events."""
-        self.events = []
-        
+        """Parse the UFW log file and return a list of events.
+
+        Logs larger than PARALLEL_PARSE_THRESHOLD are parsed across several
+        processes; smaller ones are not worth the process start-up cost.
+        """
+        self.events = list(self._iter_events_auto())
+        return self.events
+
+    def parse_parallel(self, n_workers: Optional[int] = None) -> List[UFWEvent]:
+        """Parse the UFW log file across several processes.
+
+        The file is split into byte ranges snapped to line boundaries and each
+        range is parsed in a separate worker. Events are returned in file order.
+        """
+        self.events = list(self._iter_events_parallel(n_workers))
+        return self.events
+
+    def _iter_events_auto(self) -> Iterator[UFWEvent]:
+        """Yield events, parsing in parallel only when it is likely to pay off."""
+        if self._prefers_parallel():
+            return self._iter_events_parallel()
+        return self._iter_events()
+
+    def _prefers_parallel(self) -> bool:
+        """Check if the log file is large enough to be worth parsing in parallel."""
+        return self._regular_file_size() > PARALLEL_PARSE_THRESHOLD
+
+    def _iter_events(self) -> Iterator[UFWEvent]:
+        """Yield events from the UFW log file one line at a time."""
         try:
-            with open(self.log_file_path, "r", encoding="utf-8") as file:
-                for line in file:
-                    # Remove newlines and join broken lines
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    event = self._parse_line(line)
-                    if event:
-                        self.events.append(event)
+            with open(self.log_file_path, "rb") as file:
+                yield from self._iter_file_range(file)
         except FileNotFoundError:
             print(f"Error: Log file not found at {self.log_file_path}")
         except PermissionError:
             print(f"Error: Permission denied when accessing {self.log_file_path}")
-        
-        return self.events
+
+    def _iter_file_range(
+        self, file: BinaryIO, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[UFWEvent]:
+        """Yield events for the lines of an open file that start within a byte range.
+
+        Regular files are memory-mapped so line splitting happens in C on the
+        page cache instead of going through Python's buffered I/O. Pipes and
+        other special files (e.g. process substitution) cannot be mapped or
+        sized and are read from start to finish with buffered I/O instead.
+        """
+        file_stat = os.fstat(file.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            yield from self._iter_raw_lines(file)
+            return
+
+        size = file_stat.st_size
+        if end is None or end > size:
+            end = size
+        if start >= end:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            _advise_sequential(mapped)
+            mapped.seek(start)
+            yield from self._iter_raw_lines(_iter_mapped_lines(mapped, end))
+
+    def _iter_raw_lines(self, raw_lines: Iterable[bytes]) -> Iterator[UFWEvent]:
+        """Yield events for raw log lines."""
+        for raw_line in raw_lines:
+            # Skip lines without a UFW entry before paying for decoding
+            # and parsing; this matters for shared syslog/kern.log files
+            if _UFW_TOKEN_BYTES not in raw_line:
+                continue
+
+            # Remove newlines and join broken lines
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+
+            event = self._parse_line(line)
+            if event:
+                yield event
+
+    def _iter_events_parallel(self, n_workers: Optional[int] = None) -> Iterator[UFWEvent]:
+        """Yield events from the UFW log file, parsing chunks in worker processes."""
+        n_workers = self._parallel_workers(n_workers)
+        if n_workers == 1:
+            yield from self._iter_events()
+            return
+
+        for events in self._map_chunks(_parse_chunk, n_workers):
+            yield from events
+
+    def _parallel_workers(self, n_workers: Optional[int] = None) -> int:
+        """Return the number of worker processes to split the log file across.
+
+        Returns 1 when parsing should stay in this process: a single worker
+        would only add pickling overhead, and pipes cannot be split into byte
+        ranges.
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        if self._regular_file_size() == 0:
+            return 1
+        return n_workers
+
+    def _map_chunks(
+        self, chunk_func: Callable[[str, int, int], _ChunkResult], n_workers: int
+    ) -> Iterator[_ChunkResult]:
+        """Apply chunk_func(log_file_path, start, end) to byte ranges of the log file.
+
+        The file is split into n_workers ranges snapped to line boundaries,
+        each processed in a separate worker. Results are yielded in file order.
+        """
+        try:
+            boundaries = self._chunk_boundaries(n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                yield from executor.map(
+                    chunk_func,
+                    [self.log_file_path] * (len(boundaries) - 1),
+                    boundaries[:-1],
+                    boundaries[1:],
+                )
+        except FileNotFoundError:
+            print(f"Error: Log file not found at {self.log_file_path}")
+        except PermissionError:
+            print(f"Error: Permission denied when accessing {self.log_file_path}")
+
+    def _regular_file_size(self) -> int:
+        """Return the log file size, or 0 if it is missing or not a regular file."""
+        try:
+            file_stat = os.stat(self.log_file_path)
+        except OSError:
+            return 0
+        return file_stat.st_size if stat.S_ISREG(file_stat.st_mode) else 0
+
+    def _chunk_boundaries(self, n_chunks: int) -> List[int]:
+        """Split the log file into byte offsets that fall on line starts."""
+        size = os.path.getsize(self.log_file_path)
+        boundaries = [0]
+        with open(self.log_file_path, "rb") as file:
+            for i in range(1, n_chunks):
+                file.seek(size * i // n_chunks)
+                file.readline()
+                offset = file.tell()
+                if offset > boundaries[-1] and offset < size:
+                    boundaries.append(offset)
+        boundaries.append(size)
+        return boundaries
 
     def _parse_line(self, line: str) -> Optional[UFWEvent]:
-        """Parse a single log line and return a UFWEvent if valid."""
-        if "UFW" not in line:
+        """Parse a single stripped log line and return a UFWEvent if valid."""
+        # Cheap substring prefilter before doing any real work
+        idx = line.find(_UFW_TOKEN)
+        if idx == -1:
             return None
 
-        # Extract timestamp - try both formats
-        timestamp_match = re.search(self.TIMESTAMP_PATTERN_ISO, line)
-        timestamp = None
-        
-        if timestamp_match:
-            try:
-                # Parse ISO format timestamp
-                timestamp_str = timestamp_match.group(1)
-                timestamp = datetime.fromisoformat(timestamp_str)
-            except ValueError:
-                pass
+        # Extract timestamp - journal lines start with an ISO 8601 date,
+        # syslog lines with a month name
+        if line[:1].isdigit():
+            timestamp = self._iso_timestamp(_TIMESTAMP_ISO_RE.match(line))
+        else:
+            timestamp = self._syslog_timestamp(_TIMESTAMP_SYSLOG_RE.match(line))
         
         if not timestamp:
-            # Try syslog format
-            timestamp_match = re.search(self.TIMESTAMP_PATTERN_SYSLOG, line)
-            if timestamp_match:
-                try:
-                    # Parse syslog format timestamp (assume current year)
-                    timestamp_str = timestamp_match.group(1)
-                    current_year = datetime.now().year
-                    timestamp = datetime.strptime(f"{current_year} {timestamp_str}", "%Y %b %d %H:%M:%S")
-                except ValueError:
-                    pass
+            # Prefixed lines (a syslog "<4>" priority, "dmesg -T" or "grep -H"
+            # output) carry the timestamp further in, so search for it
+            timestamp = (
+                self._iso_timestamp(_TIMESTAMP_ISO_RE.search(line))
+                or self._syslog_timestamp(_TIMESTAMP_SYSLOG_RE.search(line))
+            )
         
         if not timestamp:
             return None
 
-        # Extract event type
-        event_type_match = re.search(self.EVENT_TYPE_PATTERN, line)
-        if event_type_match:
-            event_type_str = event_type_match.group(1)
-            if event_type_str == "BLOCK":
-                event_type = UFWEventType.BLOCK
-            elif event_type_str == "ALLOW":
-                event_type = UFWEventType.ALLOW
-            elif event_type_str == "AUDIT":
-                event_type = UFWEventType.AUDIT
-            else:
-                event_type = UFWEventType.UNKNOWN
-        else:
-            event_type = UFWEventType.UNKNOWN
+        event_type = _classify_event_type(line, idx)
 
-        # Extract IP addresses and ports
-        source_ip = self._extract_pattern(self.SRC_PATTERN, line)
-        destination_ip = self._extract_pattern(self.DST_PATTERN, line)
-        
-        source_port_str = self._extract_pattern(self.SPT_PATTERN, line)
-        source_port = int(source_port_str) if source_port_str else None
+        # The rest of the line is a flat list of KEY=VALUE tokens
+        fields = _split_fields(line[idx:])
+
+        source_ip = fields.get("SRC") or None
+        if source_ip:
+            source_ip = _normalize_ip(source_ip)
+        destination_ip = fields.get("DST") or None
+        if destination_ip:
+            destination_ip = _normalize_ip(destination_ip)
+
+        # Truncated or corrupted lines can carry non-numeric ports; ignore them
+        # rather than failing the whole parse
+        source_port_str = fields.get("SPT", "")
+        source_port = int(source_port_str) if source_port_str.isdecimal() else None
         
-        destination_port_str = self._extract_pattern(self.DPT_PATTERN, line)
-        destination_port = int(destination_port_str) if destination_port_str else None
+        destination_port_str = fields.get("DPT", "")
+        destination_port = int(destination_port_str) if destination_port_str.isdecimal() else None
         
-        protocol = self._extract_pattern(self.PROTO_PATTERN, line)
-        interface = self._extract_pattern(self.IN_PATTERN, line)
+        # Protocols and interfaces take only a handful of values; interning
+        # lets every event share one string per value
+        protocol = fields.get("PROTO")
+        protocol = sys.intern(protocol) if protocol else None
+        interface = fields.get("IN")
+        interface = sys.intern(interface) if interface else None
 
         return UFWEvent(
             timestamp=timestamp,
@@ -191,39 +461,50 @@ class UFWLogParser:
             destination_port=destination_port,
             protocol=protocol,
             interface=interface,
-            raw_log=line.strip()
+            raw_log=line,
+            source_is_public=bool(source_ip) and _is_public_ip(source_ip),
+            destination_is_public=bool(destination_ip) and _is_public_ip(destination_ip)
         )
 
-    def _extract_pattern(self, pattern: str, text: str) -> Optional[str]:
-        """Extract a pattern from text."""
-        match = re.search(pattern, text)
-        if not match:
-            return None
-            
-        value = match.group(1)
-        
-        # Handle IPv6 addresses
-        if pattern in [self.SRC_PATTERN, self.DST_PATTERN] and ":" in value:
-            # Convert from 0000:0000:0000:0000:0000:0000:0000:0001 format to standard IPv6
+    def _iso_timestamp(self, match: Optional[Match[str]]) -> Optional[datetime]:
+        """Parse an ISO 8601 timestamp match, or return None."""
+        if match:
             try:
-                # Try to parse as is first
-                ip_address(value)
-                return value
+                return datetime.fromisoformat(match.group(1))
             except ValueError:
-                try:
-                    # Try to normalize the address
-                    parts = value.split(":")
-                    normalized = ":".join([part.lstrip("0") or "0" for part in parts])
-                    ip_address(normalized)
-                    return normalized
-                except ValueError:
-                    # If all else fails, return as is
-                    return value
-        
-        return value
+                pass
+        return None
+
+    def _syslog_timestamp(self, match: Optional[Match[str]]) -> Optional[datetime]:
+        """Parse a syslog timestamp match (assuming the current year), or return None."""
+        if match:
+            try:
+                return _parse_syslog_timestamp(match.group(1), self._current_year)
+            except (KeyError, ValueError):
+                pass
+        return None
+
+    def _load_saved_dns(self) -> PersistentCache:
+        """Load domain names resolved by previous runs into dns_cache."""
+        if self._saved_dns is None:
+            self._saved_dns = PersistentCache(self.dns_cache_file)
+            for ip_addr, domain in self._saved_dns.items():
+                self.dns_cache.setdefault(ip_addr, domain)
+        return self._saved_dns
 
     def resolve_domain(self, ip_addr: str) -> str:
-        """Resolve IP address to domain name."""
+        """Resolve IP address to domain name.
+
+        The result is saved to dns_cache_file right away; use resolve_domains
+        to look up many addresses with a single write.
+        """
+        domain = self._resolve_domain(ip_addr)
+        self._load_saved_dns().save()
+        return domain
+
+    def _resolve_domain(self, ip_addr: str) -> str:
+        """Resolve IP address to domain name without writing the saved cache."""
+        saved_dns = self._load_saved_dns()
         if ip_addr in self.dns_cache:
             return self.dns_cache[ip_addr]
         
@@ -242,11 +523,45 @@ class UFWLogParser:
                 domain = domain[:-1]
                 
             self.dns_cache[ip_addr] = domain
+            # Keep the answer for as long as its TTL allows, capped by config
+            ttl = config.get("dns_cache_ttl", 86400)
+            if result.rrset is not None:
+                ttl = min(result.rrset.ttl, ttl)
+            saved_dns.set(ip_addr, domain, ttl)
             return domain
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            # Most scanners have no PTR record; remember that across runs
+            # so they are not looked up again every time
+            self.dns_cache[ip_addr] = ip_addr
+            saved_dns.set(ip_addr, ip_addr, config.get("dns_cache_ttl", 86400))
+            return ip_addr
         except (DNSException, ValueError):
+            # Timeouts and unreachable name servers may be temporary, so
+            # they are only remembered for this run
             self.dns_cache[ip_addr] = ip_addr
             return ip_addr
 
+    def resolve_domains(self, ip_list: Iterable[str]) -> Dict[str, str]:
+        """Resolve many IP addresses to domain names concurrently.
+
+        Reverse lookups are network bound, so uncached addresses are resolved
+        in a thread pool. Results are stored in dns_cache as usual, and
+        resolved names and missing PTR records are saved to dns_cache_file
+        for later runs.
+        """
+        saved_dns = self._load_saved_dns()
+        ip_list = list(dict.fromkeys(ip_list))
+        unresolved = [ip_addr for ip_addr in ip_list if ip_addr not in self.dns_cache]
+        if unresolved:
+            workers = min(DNS_WORKERS, len(unresolved))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # _resolve_domain fills dns_cache; consume the results to
+                # surface any unexpected exception
+                list(executor.map(self._resolve_domain, unresolved))
+            saved_dns.save()
+
+        return {ip_addr: self.dns_cache[ip_addr] for ip_addr in ip_list}
+
     def group_by_event_type(self) -> Dict[UFWEventType, List[UFWEvent]]:
         """Group events by their type."""
         result: Dict[UFWEventType, List[UFWEvent]] = {}
@@ -258,52 +573,58 @@ class UFWLogParser:
 
     def deduplicate_by_ip(self) -> Dict[str, Tuple[int, UFWEvent]]:
         """Deduplicate events by IP address and count occurrences."""
-        ip_counts: Dict[str, Tuple[int, UFWEvent]] = {}
-        
+        ip_counts: Dict[str, _IPCount] = {}
         for event in self.events:
-            # Process source IP if it's public
-            if event.source_ip and event.source_is_public:
-                if event.source_ip not in ip_counts:
-                    ip_counts[event.source_ip] = (1, event)
-                else:
-                    count, first_event = ip_counts[event.source_ip]
-                    ip_counts[event.source_ip] = (count + 1, first_event)
-            
-            # Process destination IP if it's public
-            if event.destination_ip and event.destination_is_public:
-                if event.destination_ip not in ip_counts:
-                    ip_counts[event.destination_ip] = (1, event)
-                else:
-                    count, first_event = ip_counts[event.destination_ip]
-                    ip_counts[event.destination_ip] = (count + 1, first_event)
-        
-        return ip_counts
+            _count_public_ips(ip_counts, event)
+        return _ip_count_tuples(ip_counts)
+
+    def summarize(
+        self,
+    ) -> Tuple[Dict[UFWEventType, List[UFWEvent]], Dict[str, Tuple[int, UFWEvent]]]:
+        """Group events by type and deduplicate them by IP in a single pass.
+
+        Returns the same results as group_by_event_type and deduplicate_by_ip
+        while walking the events only once.
+        """
+        by_type: DefaultDict[UFWEventType, List[UFWEvent]] = defaultdict(list)
+        ip_counts: Dict[str, _IPCount] = {}
+        for event in self.events:
+            by_type[event.event_type].append(event)
+            _count_public_ips(ip_counts, event)
+        return dict(by_type), _ip_count_tuples(ip_counts)
+
     def is_public_ip(self, ip_str: str) -> bool:
         """Check if an IP address is public."""
         if not ip_str:
             return False
-            
-        # Skip multicast addresses
-        if ip_str.startswith("224.") or ip_str.startswith("239."):
-            return False
-            
-        try:
-            # Handle IPv6 addresses
-            if ":" in ip_str:
-                # Try to normalize the address if needed
-                try:
-                    ip = ip_address(ip_str)
-                except ValueError:
-                    parts = ip_str.split(":")
-                    normalized = ":".join([part.lstrip("0") or "0" for part in parts])
-                    ip = ip_address(normalized)
-                
-                return not (ip.is_private or ip.is_loopback or ip.is_link_local or 
-                           ip.is_multicast or ip.is_unspecified or ip.is_reserved)
-            else:
-                # Handle IPv4
-                ip = ip_address(ip_str)
-                return not (ip.is_private or ip.is_loopback or ip.is_link_local or 
-                           ip.is_multicast or ip.is_unspecified or ip.is_reserved)
-        except ValueError:
-            return False
+        return _is_public_ip(ip_str)
+
+
+def _advise_sequential(mapped: mmap.mmap) -> None:
+    """Tell the kernel a mapped file will be read sequentially.
+
+    This enables a larger read-ahead window so disk I/O overlaps with
+    parsing. It is a no-op on platforms without madvise.
+    """
+    if not hasattr(mmap, "MADV_SEQUENTIAL"):
+        return
+    try:
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def _iter_mapped_lines(mapped: mmap.mmap, end: int) -> Iterator[bytes]:
+    """Yield lines from the current position of a mapped file up to offset end."""
+    while mapped.tell() < end:
+        raw_line = mapped.readline()
+        if not raw_line:
+            break
+        yield raw_line
+
+
+def _parse_chunk(log_file_path: str, start: int, end: int) -> List[UFWEvent]:
+    """Parse the lines of a log file that start within a byte range."""
+    parser = UFWLogParser(log_file_path)
+    with open(log_file_path, "rb") as file:
+        return list(parser._iter_file_range(file, start, end))
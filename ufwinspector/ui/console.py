@@ -1,6 +1,8 @@
 """Console UI for UFWInspector."""
 
-from typing import List
+import sys
+from operator import attrgetter
+from typing import Iterable, List, Tuple
 
 from rich.console import Console
 from rich.table import Table
@@ -10,6 +12,16 @@ from ..core.analyzer import IPSummary
 from ..core.parser import UFWEventType
 
 
+def _event_names(event_types: Iterable[UFWEventType]) -> List[str]:
+    """Return event type names in a stable display order."""
+    return [et.name for et in sorted(event_types, key=lambda et: et.value)]
+
+
+def _isp_info(summary: IPSummary) -> str:
+    """Return the ISP to show, only for addresses without a domain name."""
+    return summary.isp if summary.domain_name == summary.ip_address else "-"
+
+
 class ConsoleUI:
     """Console UI for displaying analysis results."""
 
@@ -34,42 +46,44 @@ class ConsoleUI:
         table.add_column("Event Types", style="yellow")
         table.add_column("Protocols", style="white")
         
-        for summary in ip_summaries:
-            # Format direction with emphasis on incoming connections
-            if summary.direction_type == "Incoming":
-                direction = "[bold red]Incoming[/bold red]"
-            elif summary.direction_type == "Outgoing":
-                direction = "[green]Outgoing[/green]"
-            else:
-                direction = "[yellow]Bidirectional[/yellow]"
-            
-            # Format event types by direction
-            source_events = [et.name for et in summary.source_event_types]
-            dest_events = [et.name for et in summary.destination_event_types]
-            
-            if summary.direction_type == "Incoming":
-                event_types = f"[bold red]{', '.join(source_events)}[/bold red]"
-            elif summary.direction_type == "Outgoing":
-                event_types = f"[green]{', '.join(dest_events)}[/green]"
-            else:
-                event_types = f"In: [red]{', '.join(source_events)}[/red], Out: [green]{', '.join(dest_events)}[/green]"
-            
-            # Show ISP info only if domain name is the same as IP (unresolved)
-            isp_info = summary.isp if summary.domain_name == summary.ip_address else "-"
-            
-            table.add_row(
-                summary.ip_address,
-                summary.domain_name,
-                isp_info,
-                direction,
-                str(summary.source_count) if summary.source_count > 0 else "-",
-                str(summary.destination_count) if summary.destination_count > 0 else "-",
-                event_types,
-                ", ".join(summary.protocols) if summary.protocols else "N/A"
-            )
+        rows = [self._summary_row(summary) for summary in ip_summaries]
+        for row in rows:
+            table.add_row(*row)
         
         self.console.print(table)
 
+    def _summary_row(self, summary: IPSummary) -> Tuple[str, ...]:
+        """Format one summary as a row of the rich summary table."""
+        # Format direction with emphasis on incoming connections
+        if summary.direction_type == "Incoming":
+            direction = "[bold red]Incoming[/bold red]"
+        elif summary.direction_type == "Outgoing":
+            direction = "[green]Outgoing[/green]"
+        else:
+            direction = "[yellow]Bidirectional[/yellow]"
+        
+        # Format event types by direction
+        source_events = _event_names(summary.source_event_types)
+        dest_events = _event_names(summary.destination_event_types)
+        
+        if summary.direction_type == "Incoming":
+            event_types = f"[bold red]{', '.join(source_events)}[/bold red]"
+        elif summary.direction_type == "Outgoing":
+            event_types = f"[green]{', '.join(dest_events)}[/green]"
+        else:
+            event_types = f"In: [red]{', '.join(source_events)}[/red], Out: [green]{', '.join(dest_events)}[/green]"
+        
+        return (
+            summary.ip_address,
+            summary.domain_name,
+            _isp_info(summary),
+            direction,
+            str(summary.source_count) if summary.source_count > 0 else "-",
+            str(summary.destination_count) if summary.destination_count > 0 else "-",
+            event_types,
+            ", ".join(sorted(summary.protocols)) if summary.protocols else "N/A"
+        )
+
     def display_plain_table(self, ip_summaries: List[IPSummary]) -> None:
         """Display results as a plain text table."""
         if not ip_summaries:
@@ -81,8 +95,8 @@ class ConsoleUI:
         
         for summary in ip_summaries:
             # Format event types by direction
-            source_events = [et.name for et in summary.source_event_types]
-            dest_events = [et.name for et in summary.destination_event_types]
+            source_events = _event_names(summary.source_event_types)
+            dest_events = _event_names(summary.destination_event_types)
             
             if summary.direction_type == "Incoming":
                 event_types = f"IN: {', '.join(source_events)}"
@@ -91,21 +105,18 @@ class ConsoleUI:
             else:
                 event_types = f"IN: {', '.join(source_events)}, OUT: {', '.join(dest_events)}"
             
-            # Show ISP info only if domain name is the same as IP (unresolved)
-            isp_info = summary.isp if summary.domain_name == summary.ip_address else "-"
-            
             table_data.append([
                 summary.ip_address,
                 summary.domain_name,
-                isp_info,
+                _isp_info(summary),
                 summary.direction_type,
                 summary.source_count if summary.source_count > 0 else "-",
                 summary.destination_count if summary.destination_count > 0 else "-",
                 event_types,
-                ", ".join(summary.protocols) if summary.protocols else "N/A"
+                ", ".join(sorted(summary.protocols)) if summary.protocols else "N/A"
             ])
         
-
+        print(tabulate(table_data, headers=headers, tablefmt="plain"))
 
     def display_tsv(self, ip_summaries: List[IPSummary]) -> None:
         """Display results as tab-separated values."""
@@ -113,14 +124,13 @@ class ConsoleUI:
             print("No public IP addresses found in the logs.")
             return
 
-        # Print header
+        # Header first, then one line per summary
         headers = ["IP_Address", "Domain_Name", "ISP", "Direction", "In_Count", "Out_Count", "Event_Types", "Protocols"]
-        print("\t".join(headers))
+        lines = ["\t".join(headers)]
         
-        # Print data rows
         for summary in ip_summaries:
-            source_events = [et.name for et in summary.source_event_types]
-            dest_events = [et.name for et in summary.destination_event_types]
+            source_events = _event_names(summary.source_event_types)
+            dest_events = _event_names(summary.destination_event_types)
             
             if summary.direction_type == "Incoming":
                 event_types = f"IN:{','.join(source_events)}"
@@ -129,19 +139,20 @@ class ConsoleUI:
             else:
                 event_types = f"IN:{','.join(source_events)},OUT:{','.join(dest_events)}"
             
-            isp_info = summary.isp if summary.domain_name == summary.ip_address else "-"
-            
             row = [
                 summary.ip_address,
                 summary.domain_name,
-                isp_info,
+                _isp_info(summary),
                 summary.direction_type,
                 str(summary.source_count) if summary.source_count > 0 else "0",
                 str(summary.destination_count) if summary.destination_count > 0 else "0",
                 event_types,
-                ",".join(summary.protocols) if summary.protocols else "N/A"
+                ",".join(sorted(summary.protocols)) if summary.protocols else "N/A"
             ]
-            print("\t".join(row))
+            lines.append("\t".join(row))
+        
+        # Write everything at once instead of once per row
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_event_type_summary(self, ip_summaries: List[IPSummary]) -> None:
         """Display a summary grouped by event type."""
@@ -149,8 +160,23 @@ class ConsoleUI:
             self.console.print("[yellow]No public IP addresses found in the logs.[/yellow]")
             return
         
+        # Partition by direction in a single pass
+        incoming_ips: List[IPSummary] = []
+        bidir_ips: List[IPSummary] = []
+        outgoing_ips: List[IPSummary] = []
+        for summary in ip_summaries:
+            if summary.direction_type == "Incoming":
+                incoming_ips.append(summary)
+            elif summary.direction_type == "Outgoing":
+                outgoing_ips.append(summary)
+            else:
+                bidir_ips.append(summary)
+        
+        incoming_ips.sort(key=attrgetter("source_count"), reverse=True)
+        bidir_ips.sort(key=attrgetter("count"), reverse=True)
+        outgoing_ips.sort(key=attrgetter("destination_count"), reverse=True)
+        
         # First, display incoming connections (highest priority)
-        incoming_ips = [s for s in ip_summaries if s.direction_type == "Incoming"]
         if incoming_ips:
             self.console.print("\n[bold red]INCOMING CONNECTIONS[/bold red] (External IPs connecting to your system)")
             
@@ -162,25 +188,21 @@ class ConsoleUI:
             table.add_column("Event Types", style="yellow")
             table.add_column("Protocols", style="white")
             
-            for summary in sorted(incoming_ips, key=lambda x: x.source_count, reverse=True):
-                source_events = [et.name for et in summary.source_event_types]
-                
-                # Show ISP info only if domain name is the same as IP (unresolved)
-                isp_info = summary.isp if summary.domain_name == summary.ip_address else "-"
+            for summary in incoming_ips:
+                source_events = _event_names(summary.source_event_types)
                 
                 table.add_row(
                     summary.ip_address,
                     summary.domain_name,
-                    isp_info,
+                    _isp_info(summary),
                     str(summary.source_count),
                     ", ".join(source_events),
-                    ", ".join(summary.protocols) if summary.protocols else "N/A"
+                    ", ".join(sorted(summary.protocols)) if summary.protocols else "N/A"
                 )
             
             self.console.print(table)
         
         # Then display bidirectional connections
-        bidir_ips = [s for s in ip_summaries if s.direction_type == "Bidirectional"]
         if bidir_ips:
             self.console.print("\n[bold yellow]BIDIRECTIONAL CONNECTIONS[/bold yellow]")
             
@@ -192,18 +214,15 @@ class ConsoleUI:
             table.add_column("Out Count", justify="right", style="magenta")
             table.add_column("Event Types", style="yellow")
             
-            for summary in sorted(bidir_ips, key=lambda x: x.count, reverse=True):
-                source_events = [et.name for et in summary.source_event_types]
-                dest_events = [et.name for et in summary.destination_event_types]
+            for summary in bidir_ips:
+                source_events = _event_names(summary.source_event_types)
+                dest_events = _event_names(summary.destination_event_types)
                 event_types = f"In: {', '.join(source_events)}, Out: {', '.join(dest_events)}"
                 
-                # Show ISP info only if domain name is the same as IP (unresolved)
-                isp_info = summary.isp if summary.domain_name == summary.ip_address else "-"
-                
                 table.add_row(
                     summary.ip_address,
                     summary.domain_name,
-                    isp_info,
+                    _isp_info(summary),
                     str(summary.source_count),
                     str(summary.destination_count),
                     event_types
@@ -212,7 +231,6 @@ class ConsoleUI:
             self.console.print(table)
         
         # Finally display outgoing connections
-        outgoing_ips = [s for s in ip_summaries if s.direction_type == "Outgoing"]
         if outgoing_ips:
             self.console.print("\n[bold green]OUTGOING CONNECTIONS[/bold green] (Your system connecting to external IPs)")
             
@@ -224,19 +242,16 @@ class ConsoleUI:
             table.add_column("Event Types", style="yellow")
             table.add_column("Protocols", style="white")
             
-            for summary in sorted(outgoing_ips, key=lambda x: x.destination_count, reverse=True):
-                dest_events = [et.name for et in summary.destination_event_types]
-                
-                # Show ISP info only if domain name is the same as IP (unresolved)
-                isp_info = summary.isp if summary.domain_name == summary.ip_address else "-"
+            for summary in outgoing_ips:
+                dest_events = _event_names(summary.destination_event_types)
                 
                 table.add_row(
                     summary.ip_address,
                     summary.domain_name,
-                    isp_info,
+                    _isp_info(summary),
                     str(summary.destination_count),
                     ", ".join(dest_events),
-                    ", ".join(summary.protocols) if summary.protocols else "N/A"
+                    ", ".join(sorted(summary.protocols)) if summary.protocols else "N/A"
                 )
             
             self.console.print(table)